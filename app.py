@@ -1,7 +1,10 @@
+import os
 import pickle
 import numpy as np
 from flask import Flask, render_template, request, jsonify
-from hotelreservation.config.config_entities import MODEL_PATH
+from hotelreservation.config.config_entities import MODEL_PATH, EXPLANATION_TOP_K, EXPLANATION_MAX_BATCH_SIZE
+from hotelreservation.logger.logger import logging
+from hotelreservation.components.model_explainer import ModelExplainer
 
 app = Flask(__name__)
 
@@ -11,59 +14,163 @@ try:
 except FileNotFoundError:
     raise RuntimeError("Model file not found. Ensure 'model.pkl' is in the root directory.")
 
+model_explainer = ModelExplainer(model=loaded_model)
+
 @app.route('/', methods=['GET'])
 def index():
     return render_template("index.html")
 
+def parse_int(value):
+    """
+    Parse an integer feature, rejecting booleans and non-integral numbers so JSON input
+    follows the same rules as form input.
+    """
+    if isinstance(value, bool):
+        raise ValueError("Invalid input format")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError("Invalid input format")
+        return int(value)
+    return int(value)
+
+def parse_float(value):
+    """
+    Parse a float feature, rejecting booleans.
+    """
+    if isinstance(value, bool):
+        raise ValueError("Invalid input format")
+    return float(value)
+
+# Form fields in the order the model was trained on, with their parsers and defaults
+FEATURES = [
+    ("lead_time", parse_int, 0),
+    ("no_of_special_request", parse_int, 0),
+    ("avg_price_per_room", parse_float, 0.0),
+    ("arrival_month", parse_int, 1),
+    ("arrival_date", parse_int, 1),
+    ("market_segment_type", parse_int, 0),
+    ("no_of_week_nights", parse_int, 0),
+    ("no_of_weekend_nights", parse_int, 0),
+    ("type_of_meal_plan", parse_int, 0),
+    ("room_type_reserved", parse_int, 0),
+]
+
+def parse_features(data):
+    """
+    Parse and validate a single booking, returning the feature row and the parsed values.
+    Raises ValueError with a user facing message when a value is out of range.
+    """
+    try:
+        values = {name: parser(data.get(name, default)) for name, parser, default in FEATURES}
+    except (TypeError, ValueError):
+        raise ValueError("Invalid input format")
+
+    # Validate input ranges
+    if not (0 <= values["lead_time"] <= 100):
+        raise ValueError("Lead time must be between 0 and 100 days")
+    if not (0 <= values["no_of_special_request"] <= 5):
+        raise ValueError("Number of special requests must be between 0 and 5")
+    if not (0 <= values["avg_price_per_room"] <= 200):
+        raise ValueError("Average price per room must be between 0 and 200")
+    if not (0 <= values["no_of_week_nights"] <= 8):
+        raise ValueError("Number of week nights must be between 0 and 8")
+    if not (0 <= values["no_of_weekend_nights"] <= 8):
+        raise ValueError("Number of weekend nights must be between 0 and 8")
+
+    return [values[name] for name, _, _ in FEATURES], values
+
+def parse_top_k(value):
+    """
+    Parse the top_k query parameter. Missing means the default, "all" means every feature.
+    Raises ValueError for anything that is not a positive integer.
+    """
+    if value is None:
+        return EXPLANATION_TOP_K
+    if value == "all":
+        return None
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError("top_k must be a positive integer or 'all'")
+    return int(value)
+
 @app.route('/result', methods=['POST'])
 def result():
     try:
         # Extract and validate form data
-        lead_time = int(request.form.get("lead_time", 0))
-        no_of_special_request = int(request.form.get("no_of_special_request", 0))
-        avg_price_per_room = float(request.form.get("avg_price_per_room", 0.0))
-        arrival_month = int(request.form.get("arrival_month", 1))
-        arrival_date = int(request.form.get("arrival_date", 1))
-        market_segment_type = int(request.form.get("market_segment_type", 0))
-        no_of_week_nights = int(request.form.get("no_of_week_nights", 0))
-        no_of_weekend_nights = int(request.form.get("no_of_weekend_nights", 0))
-        type_of_meal_plan = int(request.form.get("type_of_meal_plan", 0))
-        room_type_reserved = int(request.form.get("room_type_reserved", 0))
-
-        # Validate input ranges
-        if not (0 <= lead_time <= 100):
-            return render_template("result.html", error="Lead time must be between 0 and 100 days")
-        if not (0 <= no_of_special_request <= 5):
-            return render_template("result.html", error="Number of special requests must be between 0 and 5")
-        if not (0 <= avg_price_per_room <= 200):
-            return render_template("result.html", error="Average price per room must be between 0 and 200")
-        if not (0 <= no_of_week_nights <= 8):
-            return render_template("result.html", error="Number of week nights must be between 0 and 8")
-        if not (0 <= no_of_weekend_nights <= 8):
-            return render_template("result.html", error="Number of weekend nights must be between 0 and 8")
+        try:
+            row, values = parse_features(request.form)
+        except ValueError as e:
+            return render_template("result.html", error=str(e))
 
         # Prepare features
-        features = np.array([[lead_time, no_of_special_request, avg_price_per_room, 
-                             arrival_month, arrival_date, market_segment_type, 
-                             no_of_week_nights, no_of_weekend_nights, type_of_meal_plan, 
-                             room_type_reserved]])
+        features = np.array([row])
 
-        # Predict
-        prediction = loaded_model.predict(features)[0]
+        # Predict and explain from the same contributions (served from the cache for repeated bookings).
+        # The explanation is best-effort, so fall back to a plain prediction if it fails.
+        try:
+            contributions = model_explainer.explain_batch(features)
+            prediction = model_explainer.predict_from_contributions(contributions)[0]
+            explanation = model_explainer.format_explanation(contributions[0])
+        except Exception as e:
+            logging.warning(f"Explanation failed, falling back to prediction only: {e}")
+            prediction = loaded_model.predict(features)[0]
+            explanation = None
 
         # Pass inputs for display
         inputs = {
-            'lead_time': lead_time,
-            'arrival_month': arrival_month,
-            'arrival_date': arrival_date
+            'lead_time': values["lead_time"],
+            'arrival_month': values["arrival_month"],
+            'arrival_date': values["arrival_date"]
         }
 
-        return render_template("result.html", prediction=int(prediction), inputs=inputs)
+        return render_template("result.html", prediction=int(prediction), inputs=inputs, explanation=explanation)
 
-    except ValueError:
-        return render_template("result.html", error="Invalid input format")
     except Exception as e:
         return render_template("result.html", error=str(e))
 
+@app.route('/explain', methods=['POST'])
+def explain():
+    """
+    Explain one booking (a JSON object) or a batch of bookings (a JSON list) in a single vectorized call.
+    """
+    payload = request.get_json(silent=True)
+    if payload is None:
+        return jsonify(error="Request body must be a JSON object or a list of JSON objects"), 400
+
+    bookings = payload if isinstance(payload, list) else [payload]
+    if not bookings or not all(isinstance(booking, dict) for booking in bookings):
+        return jsonify(error="Request body must be a JSON object or a list of JSON objects"), 400
+    if len(bookings) > EXPLANATION_MAX_BATCH_SIZE:
+        return jsonify(error=f"At most {EXPLANATION_MAX_BATCH_SIZE} bookings can be explained per request"), 400
+
+    try:
+        features = np.array([parse_features(booking)[0] for booking in bookings])
+        top_k = parse_top_k(request.args.get("top_k"))
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+
+    try:
+        contributions = model_explainer.explain_batch(features)
+        predictions = model_explainer.predict_from_contributions(contributions)
+        results = [dict(prediction=int(prediction), **model_explainer.format_explanation(row, top_k=top_k))
+                   for prediction, row in zip(predictions, contributions)]
+    except Exception as e:
+        logging.error(f"Explanation failed: {e}")
+        return jsonify(error="Failed to explain the bookings"), 500
+
+    return jsonify(results if isinstance(payload, list) else results[0])
+
+@app.route('/explain/global', methods=['GET'])
+def explain_global():
+    """
+    Return the global feature importance precomputed during model training.
+    """
+    if not os.path.exists(model_explainer.feature_importance_path):
+        return jsonify(error="Global feature importance is not available. Run model training first."), 404
+    try:
+        return jsonify(model_explainer.load_global_importance())
+    except Exception as e:
+        logging.error(f"Loading global feature importance failed: {e}")
+        return jsonify(error="Failed to load global feature importance"), 500
+
 if __name__ == "__main__":
     app.run(host='0.0.0.0', port=8080, debug=True)
\ No newline at end of file
@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import pickle
+import threading
+import numpy as np
+from collections import OrderedDict
+
+from hotelreservation.config.config_entities import *
+from hotelreservation.logger.logger import logging
+from hotelreservation.exception.exception import CustomException
+
+class ModelExplainer:
+    """
+    This class is responsible for explaining the predictions of the trained LightGBM model.
+    It uses LightGBM's native SHAP-style per-feature contributions (pred_contrib) and keeps
+    an LRU cache of contributions keyed by the feature tuple, so repeated bookings are served
+    without walking the trees again. Contributions are in log-odds space and a positive value
+    pushes the booking towards being honored (booking_status = 1).
+    """
+    def __init__(self, model, feature_importance_path: str = FEATURE_IMPORTANCE_PATH,
+                 cache_size: int = EXPLANATION_CACHE_SIZE):
+        self.model = model
+        self.feature_names = list(model.feature_name_)
+        self.feature_importance_path = feature_importance_path
+
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+        self.global_importance = None
+
+    @staticmethod
+    def compute_contributions(model, X) -> np.ndarray:
+        """
+        Compute per-feature contributions for a batch of rows in a single vectorized call.
+        The last column of the returned array holds the expected value (bias) of the model.
+        """
+        try:
+            return np.asarray(model.predict(X, pred_contrib = True), dtype = np.float64)
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    @staticmethod
+    def summarize_importance(feature_names: list, contributions: np.ndarray) -> dict:
+        """
+        Summarize contributions into a global importance ranking (mean absolute contribution per feature).
+        """
+        try:
+            mean_abs = np.abs(contributions[:, :-1]).mean(axis = 0)
+            order = np.argsort(mean_abs)[::-1]
+            return {
+                "expected_value": float(contributions[:, -1].mean()),
+                "importance": [{"feature": feature_names[i], "mean_abs_contribution": float(mean_abs[i])} for i in order]
+            }
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def load_global_importance(self) -> dict:
+        """
+        Load the global importance summary precomputed during model training.
+        """
+        try:
+            if self.global_importance is None:
+                if not os.path.exists(self.feature_importance_path):
+                    raise FileNotFoundError(f"The file {self.feature_importance_path} does not exist.")
+                with open(self.feature_importance_path, "r") as file:
+                    self.global_importance = json.load(file)
+                logging.info(f"Global feature importance loaded from {self.feature_importance_path}")
+            return self.global_importance
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def _cache_get(self, key: tuple):
+        with self.cache_lock:
+            contribution = self.cache.get(key)
+            if contribution is not None:
+                self.cache.move_to_end(key)
+            return contribution
+
+    def _cache_put(self, key: tuple, contribution: np.ndarray):
+        if self.cache_size <= 0:
+            return
+        with self.cache_lock:
+            self.cache[key] = contribution
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last = False)
+
+    def explain_batch(self, X) -> np.ndarray:
+        """
+        Return the contribution matrix for a batch of rows, shaped (n_rows, n_features + 1).
+        Cached rows are served from the cache and all remaining rows are computed together.
+        """
+        try:
+            X = np.asarray(X, dtype = np.float64)
+            if X.ndim == 1:
+                X = X.reshape(1, -1)
+
+            contributions = np.empty((X.shape[0], len(self.feature_names) + 1), dtype = np.float64)
+            keys = [tuple(row) for row in X.tolist()]
+
+            # Deduplicate the missing rows so identical bookings are only computed once
+            missing = OrderedDict()
+            for idx, key in enumerate(keys):
+                cached = self._cache_get(key)
+                if cached is None:
+                    missing.setdefault(key, []).append(idx)
+                else:
+                    contributions[idx] = cached
+
+            if missing:
+                computed = self.compute_contributions(self.model, np.array(list(missing.keys()), dtype = np.float64))
+                for row, (key, indices) in zip(computed, missing.items()):
+                    contributions[indices] = row
+                    # Copy the row so the cache does not keep the whole batch matrix alive
+                    self._cache_put(key, row.copy())
+
+            return contributions
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    @staticmethod
+    def predict_from_contributions(contributions: np.ndarray) -> np.ndarray:
+        """
+        Derive the predicted labels from a contribution matrix. Each row sums to the raw log-odds
+        score, so the booking is predicted as honored (1) when that sum is positive.
+        """
+        return (contributions.sum(axis = 1) > 0).astype(int)
+
+    def format_explanation(self, contribution: np.ndarray, top_k: int = EXPLANATION_TOP_K) -> dict:
+        """
+        Convert a single contribution row into a response ordered by absolute contribution.
+        """
+        feature_contributions = contribution[:-1]
+        order = np.argsort(np.abs(feature_contributions))[::-1]
+        if top_k is not None:
+            order = order[:top_k]
+
+        return {
+            "expected_value": float(contribution[-1]),
+            "contributions": [{"feature": self.feature_names[i], "contribution": float(feature_contributions[i])} for i in order]
+        }
+
+    def explain(self, X, top_k: int = EXPLANATION_TOP_K) -> list:
+        """
+        Explain one or more rows, returning the top_k contributing features for each of them.
+        """
+        try:
+            contributions = self.explain_batch(X)
+            return [self.format_explanation(row, top_k = top_k) for row in contributions]
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+
+if __name__ == "__main__":
+
+    with open(MODEL_PATH, "rb") as f:
+        model = pickle.load(f)
+
+    model_explainer = ModelExplainer(model = model)
+    print(model_explainer.load_global_importance())
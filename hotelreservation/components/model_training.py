@@ -1,5 +1,6 @@
 import os
 import sys
+import json
 import pickle
 import numpy as np
 import pandas as pd
@@ -13,6 +14,7 @@ import mlflow.sklearn
 from hotelreservation.config.config_entities import *
 from hotelreservation.config.model_params import *
 from hotelreservation.utils.main_utils import load_data, read_yaml_file
+from hotelreservation.components.model_explainer import ModelExplainer
 from hotelreservation.logger.logger import logging
 from hotelreservation.exception.exception import CustomException
 
@@ -26,6 +28,7 @@ class ModelTraining:
         self.train_path = train_path
         self.test_path = test_path
         self.model_path = MODEL_PATH
+        self.feature_importance_path = FEATURE_IMPORTANCE_PATH
 
         self.lgbm_params = LIGHTGBM_PARAMS
         self.random_search_params = RANDOM_SEARCH_PARAMS
@@ -129,6 +132,24 @@ class ModelTraining:
 
         except Exception as e:
             raise CustomException(e, sys)
+
+    def save_feature_importance(self, model, X_test):
+        """
+        Precompute the global feature importance from per-feature contributions on the test data
+        and save it alongside the model, so the application does not recompute it per request.
+        """
+        try:
+            logging.info("Computing global feature importance..")
+            contributions = ModelExplainer.compute_contributions(model, X_test)
+            feature_importance = ModelExplainer.summarize_importance(list(X_test.columns), contributions)
+
+            os.makedirs(os.path.dirname(self.feature_importance_path), exist_ok = True)
+            with open(self.feature_importance_path, "w") as file:
+                json.dump(feature_importance, file, indent = 4)
+            logging.info(f"Feature importance saved to {self.feature_importance_path}")
+
+        except Exception as e:
+            raise CustomException(e, sys)
         
 
     def initiate_model_training(self):
@@ -156,6 +177,9 @@ class ModelTraining:
                 logging.info("Saving the model into MLFlow")
                 mlflow.log_artifact(self.model_path, artifact_path = "models") # Logging model artifact
 
+                self.save_feature_importance(model = best_lgbm_model, X_test = X_test)
+                mlflow.log_artifact(self.feature_importance_path, artifact_path = "models") # Logging feature importance artifact
+
                 logging.info("Saving params and metrics into MLFlow")
                 mlflow.log_params(best_lgbm_model.get_params()) # Logging model parameters
                 mlflow.log_metrics(metrics = metrics)           # Logging model metrics
@@ -23,4 +23,13 @@ TARGET_COLUMN = 'booking_status'
 """
 Model Training related paths configuration
 """
-MODEL_PATH = 'artifacts/model_training/lgbm.pkl'
\ No newline at end of file
+MODEL_PATH = 'artifacts/model_training/lgbm.pkl'
+FEATURE_IMPORTANCE_PATH = 'artifacts/model_training/feature_importance.json'
+
+
+"""
+Model Explanation related configuration
+"""
+EXPLANATION_CACHE_SIZE = 1024
+EXPLANATION_TOP_K = 3
+EXPLANATION_MAX_BATCH_SIZE = 1000
\ No newline at end of file
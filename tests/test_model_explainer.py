@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+import lightgbm as lgbm
+
+from hotelreservation.components.model_explainer import ModelExplainer
+
+
+@pytest.fixture(scope = "module")
+def model():
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size = (200, 3)), columns = ["lead_time", "avg_price_per_room", "arrival_month"])
+    Y = (X["lead_time"] + 0.5 * X["avg_price_per_room"] > 0).astype(int)
+    return lgbm.LGBMClassifier(n_estimators = 10, num_leaves = 4, min_child_samples = 5, verbose = -1).fit(X, Y)
+
+
+class CountingModel:
+    """ Wraps a model and records the number of rows passed to each predict call """
+
+    def __init__(self, model):
+        self.model = model
+        self.feature_name_ = model.feature_name_
+        self.calls = []
+
+    def predict(self, X, **kwargs):
+        self.calls.append(len(X))
+        return self.model.predict(X, **kwargs)
+
+
+def test_contributions_match_pred_contrib(model):
+    X = np.array([[0.1, -0.2, 0.3], [1.0, 2.0, -1.0]])
+    explainer = ModelExplainer(model = model)
+
+    contributions = explainer.explain_batch(X)
+
+    np.testing.assert_allclose(contributions, model.predict(X, pred_contrib = True))
+    np.testing.assert_array_equal(explainer.predict_from_contributions(contributions), model.predict(X))
+
+
+def test_duplicate_rows_are_computed_once(model):
+    counting_model = CountingModel(model)
+    explainer = ModelExplainer(model = counting_model)
+    X = np.array([[0.1, -0.2, 0.3], [0.1, -0.2, 0.3], [1.0, 2.0, -1.0]])
+
+    contributions = explainer.explain_batch(X)
+
+    assert counting_model.calls == [2]
+    np.testing.assert_array_equal(contributions[0], contributions[1])
+
+    explainer.explain_batch(X)
+    assert counting_model.calls == [2]
+
+
+def test_cache_evicts_least_recently_used(model):
+    explainer = ModelExplainer(model = model, cache_size = 2)
+    a, b, c = [0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]
+
+    explainer.explain_batch([a])
+    explainer.explain_batch([b])
+    explainer.explain_batch([a])
+    explainer.explain_batch([c])
+
+    assert len(explainer.cache) == 2
+    assert list(explainer.cache.keys()) == [tuple(a), tuple(c)]
+
+
+def test_cached_rows_do_not_reference_the_batch(model):
+    explainer = ModelExplainer(model = model)
+
+    explainer.explain_batch([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+
+    assert all(row.base is None for row in explainer.cache.values())
+
+
+def test_explain_response_shape(model):
+    explainer = ModelExplainer(model = model)
+
+    single = explainer.explain([0.1, 0.2, 0.3], top_k = 2)
+    batch = explainer.explain([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], top_k = None)
+
+    assert len(single) == 1
+    assert len(single[0]["contributions"]) == 2
+    assert len(batch) == 2
+    assert all(len(explanation["contributions"]) == 3 for explanation in batch)